@@ -41,6 +41,7 @@ class StickyNoteApplication:
     def _setup_controller_callbacks(self) -> None:
         """コントローラーのコールバックを設定"""
         self.note_controller.on_notes_changed = self._on_notes_changed
+        self.note_controller.on_note_updated = self._on_note_updated
         self.note_controller.on_status_update = self._on_status_update
     
     def _setup_view_callbacks(self) -> None:
@@ -90,6 +91,14 @@ class StickyNoteApplication:
             selected_note = self.note_controller.get_note_by_id(selected_id)
             self.main_window.update_preview(selected_note)
     
+    def _on_note_updated(self, note: NoteData) -> None:
+        """単一の付箋が更新されたときの処理"""
+        self.main_window.update_note_row(note.id)
+        
+        # 更新された付箋が選択中であればプレビューも更新
+        if self.main_window.get_selected_note_id() == note.id:
+            self.main_window.update_preview(note)
+    
     def _on_status_update(self, message: str) -> None:
         """ステータス更新時の処理"""
         self.main_window.update_status(message)
@@ -125,4 +134,5 @@ class StickyNoteApplication:
     def _on_application_exit(self) -> None:
         """アプリケーション終了時の処理"""
         self.note_controller.shutdown()
+        self.storage_service.close()
         self.main_window.destroy()
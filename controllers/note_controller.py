@@ -1,5 +1,5 @@
 """付箋コントローラー - ビジネスロジックを管理"""
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Set
 from models.note_model import NoteData
 from services.storage_service import StorageService
 from services.ui_service import UIService
@@ -7,7 +7,8 @@ from services.language_service import get_language_service
 from views.note_window import StickyNoteWindow
 from utils.constants import (
     STATUS_CREATED, STATUS_EDITING, STATUS_DELETED, STATUS_COLOR_CHANGED,
-    MSG_ERROR_NOTE_DATA
+    MSG_ERROR_NOTE_DATA, SAVE_DEBOUNCE_INTERVAL, WRITE_RESULT_POLL_INTERVAL,
+    ID_SUFFIX_SEPARATOR
 )
 
 
@@ -19,10 +20,18 @@ class NoteController:
         self.main_window = main_window  # メインウィンドウの参照を保持
         self.open_windows: Dict[str, StickyNoteWindow] = {}
         self.all_notes: List[NoteData] = []
+        self._notes_by_id: Dict[str, NoteData] = {}  # all_notes のID索引
         self.language_service = get_language_service()
         
+        # 保存の遅延書き込み用変数
+        self._save_dirty = False
+        self._save_after_id: Optional[str] = None
+        self._write_poll_after_id: Optional[str] = None
+        self._dirty_note_ids: Set[str] = set()  # 保存時にウィンドウから内容を取り込む付箋
+        
         # コールバック
         self.on_notes_changed: Optional[Callable[[List[NoteData]], None]] = None
+        self.on_note_updated: Optional[Callable[[NoteData], None]] = None
         self.on_status_update: Optional[Callable[[str], None]] = None
     
     def set_main_window(self, main_window) -> None:
@@ -31,11 +40,19 @@ class NoteController:
     
     def initialize(self) -> None:
         """コントローラーを初期化"""
-        self.all_notes = self.storage_service.load_all_notes()
+        self.all_notes = []
+        self._notes_by_id = {}
+        renamed = False
+        for note in self.storage_service.load_all_notes():
+            renamed = self._add_note_data(note) or renamed
+        
+        # 重複していたIDを付け直した場合は保存
+        if renamed:
+            self._schedule_save()
         
-        # 前回開いていた付箋を再表示
+        # 前回終了時に開いていた付箋のみを再表示（was_open は再表示の対象外）
         for note in self.all_notes:
-            if note.is_open or note.was_open:
+            if note.is_open:
                 self._create_note_window(note)
         
         if self.on_notes_changed:
@@ -44,8 +61,8 @@ class NoteController:
     def create_new_note(self, text: str = "") -> None:
         """新しい付箋を作成"""
         note = NoteData.create_new(text)
-        self.all_notes.append(note)
-        self.storage_service.save_all_notes(self.all_notes)
+        self._add_note_data(note)
+        self._schedule_save()
         
         window = self._create_note_window(note)
         window.focus_text_area()
@@ -73,7 +90,10 @@ class NoteController:
             note.is_open = True
             window = self._create_note_window(note)
             window.focus_text_area()
-            self.storage_service.save_all_notes(self.all_notes)
+            self._schedule_save()
+            
+            if self.on_note_updated:
+                self.on_note_updated(note)
         else:
             UIService.show_error(self.language_service.translate("msg_error_note_data"))
     
@@ -83,15 +103,13 @@ class NoteController:
             return False
         
         # 開いているウィンドウを閉じる
-        if note_id in self.open_windows:
-            window = self.open_windows[note_id]
-            if window.winfo_exists():
-                window.destroy()
-            del self.open_windows[note_id]
+        window = self.open_windows.pop(note_id, None)
+        if window is not None and window.winfo_exists():
+            window.teardown()
         
         # データから削除
-        self.all_notes = [note for note in self.all_notes if note.id != note_id]
-        self.storage_service.save_all_notes(self.all_notes)
+        self._remove_note_data(note_id)
+        self._schedule_save()
         
         if self.on_status_update:
             self.on_status_update(self.language_service.translate("status_deleted", note_id))
@@ -121,13 +139,13 @@ class NoteController:
             if window.winfo_exists():
                 window.apply_color_change(new_color)
         
-        self.storage_service.save_all_notes(self.all_notes)
+        self._schedule_save()
         
         if self.on_status_update:
             self.on_status_update(self.language_service.translate("status_color_changed", note_id))
         
-        if self.on_notes_changed:
-            self.on_notes_changed(self.all_notes)
+        if self.on_note_updated:
+            self.on_note_updated(note)
     
     def get_all_notes(self) -> List[NoteData]:
         """すべての付箋データを取得"""
@@ -146,10 +164,7 @@ class NoteController:
                 if note:
                     window._update_note_data()
                     # データを更新
-                    for i, existing_note in enumerate(self.all_notes):
-                        if existing_note.id == note_id:
-                            self.all_notes[i] = window.note_data
-                            break
+                    self._replace_note_data(note_id, window.note_data)
             else:
                 # ウィンドウが閉じられている場合
                 del self.open_windows[note_id]
@@ -159,7 +174,7 @@ class NoteController:
         for note in self.all_notes:
             note.is_open = note.id in open_note_ids
         
-        self.storage_service.save_all_notes(self.all_notes)
+        self._schedule_save()
         
         if self.on_notes_changed:
             self.on_notes_changed(self.all_notes)
@@ -176,6 +191,50 @@ class NoteController:
                 note.was_open = True
         
         self.save_all_notes()
+        self.flush_save()
+        
+        # 最終的な書き込み結果は StorageService.close で確認する
+        if self._write_poll_after_id is not None:
+            self.main_window.after_cancel(self._write_poll_after_id)
+            self._write_poll_after_id = None
+    
+    def flush_save(self) -> None:
+        """保留中の保存を即座に書き込む"""
+        if self._save_after_id is not None:
+            self.main_window.after_cancel(self._save_after_id)
+            self._save_after_id = None
+        
+        self._sync_dirty_notes()
+        if self._save_dirty:
+            self._save_dirty = False
+            if self.storage_service.save_all_notes(self.all_notes):
+                self._schedule_write_result_check()
+    
+    def _schedule_write_result_check(self) -> None:
+        """バックグラウンド書き込みの結果確認を予約"""
+        if self.main_window is None or not self.storage_service.is_async_write():
+            return
+        if self._write_poll_after_id is None:
+            self._write_poll_after_id = self.main_window.after(WRITE_RESULT_POLL_INTERVAL, self._check_write_result)
+    
+    def _check_write_result(self) -> None:
+        """バックグラウンド書き込みの結果を確認（完了するまで再確認）"""
+        self._write_poll_after_id = None
+        if self.storage_service.check_write_result() is None:
+            self._schedule_write_result_check()
+    
+    def _schedule_save(self) -> None:
+        """保存を予約（短時間に連続した変更を1回の書き込みにまとめる）"""
+        self._save_dirty = True
+        if self.main_window is None:
+            self.flush_save()
+        elif self._save_after_id is None:
+            self._save_after_id = self.main_window.after(SAVE_DEBOUNCE_INTERVAL, self._flush_scheduled_save)
+    
+    def _flush_scheduled_save(self) -> None:
+        """予約された保存を実行"""
+        self._save_after_id = None
+        self.flush_save()
     
     def _create_note_window(self, note: NoteData) -> StickyNoteWindow:
         """付箋ウィンドウを作成"""
@@ -183,6 +242,7 @@ class NoteController:
         
         # コールバックを設定
         window.on_save = self._on_note_saved
+        window.on_modified = self._mark_dirty
         window.on_close = self._on_note_closed
         window.on_color_change = self._on_note_color_changed
         
@@ -191,28 +251,73 @@ class NoteController:
     
     def _find_note_by_id(self, note_id: str) -> Optional[NoteData]:
         """指定したIDの付箋を検索"""
-        for note in self.all_notes:
-            if note.id == note_id:
-                return note
-        return None
+        return self._notes_by_id.get(note_id)
+    
+    def _add_note_data(self, note: NoteData) -> bool:
+        """付箋データを追加（リストと索引を同時に更新）。IDを付け直した場合は True"""
+        renamed = self._ensure_unique_id(note)
+        self.all_notes.append(note)
+        self._notes_by_id[note.id] = note
+        return renamed
+    
+    def _ensure_unique_id(self, note: NoteData) -> bool:
+        """IDが空または既存の付箋と重複する場合は連番を付けて一意にする"""
+        if note.id and note.id not in self._notes_by_id:
+            return False
+        
+        suffix = 2 if note.id else 1
+        while f"{note.id}{ID_SUFFIX_SEPARATOR}{suffix}" in self._notes_by_id:
+            suffix += 1
+        note.id = f"{note.id}{ID_SUFFIX_SEPARATOR}{suffix}"
+        return True
+    
+    def _remove_note_data(self, note_id: str) -> None:
+        """付箋データを削除（リストと索引を同時に更新）"""
+        note = self._notes_by_id.pop(note_id, None)
+        if note is not None:
+            self.all_notes.remove(note)
+    
+    def _replace_note_data(self, note_id: str, new_note: NoteData) -> None:
+        """付箋データを置き換え（リストと索引を同時に更新）"""
+        old_note = self._notes_by_id.get(note_id)
+        if old_note is None or old_note is new_note:
+            # ウィンドウは通常同じデータオブジェクトを共有しているため置き換え不要
+            return
+        self.all_notes[self.all_notes.index(old_note)] = new_note
+        self._notes_by_id[note_id] = new_note
     
     def _on_note_saved(self, note_data: NoteData) -> None:
         """付箋が保存されたときのコールバック"""
         # データを更新
-        for i, note in enumerate(self.all_notes):
-            if note.id == note_data.id:
-                self.all_notes[i] = note_data
-                break
+        self._replace_note_data(note_data.id, note_data)
         
-        self.storage_service.save_all_notes(self.all_notes)
+        self._schedule_save()
         
-        if self.on_notes_changed:
-            self.on_notes_changed(self.all_notes)
+        if self.on_note_updated:
+            self.on_note_updated(note_data)
+    
+    def _mark_dirty(self, note_id: str) -> None:
+        """付箋を変更ありとして記録し、保存を予約（内容の取り込みは保存時に行う）"""
+        self._dirty_note_ids.add(note_id)
+        self._schedule_save()
+    
+    def _sync_dirty_notes(self) -> None:
+        """変更のあった付箋ウィンドウの内容をデータに反映"""
+        dirty_note_ids, self._dirty_note_ids = self._dirty_note_ids, set()
+        for note_id in dirty_note_ids:
+            window = self.open_windows.get(note_id)
+            if window is None or not window.winfo_exists():
+                continue
+            
+            window._update_note_data()
+            self._replace_note_data(note_id, window.note_data)
+            
+            if self.on_note_updated:
+                self.on_note_updated(window.note_data)
     
     def _on_note_closed(self, note_id: str) -> None:
         """付箋が閉じられたときのコールバック"""
-        if note_id in self.open_windows:
-            del self.open_windows[note_id]
+        self.open_windows.pop(note_id, None)
         
         # データの状態を更新
         note = self._find_note_by_id(note_id)
@@ -220,12 +325,13 @@ class NoteController:
             note.is_open = False
             note.was_open = True
         
-        self.storage_service.save_all_notes(self.all_notes)
+        self._schedule_save()
         
-        if self.on_notes_changed:
-            self.on_notes_changed(self.all_notes)
+        if note and self.on_note_updated:
+            self.on_note_updated(note)
     
     def _on_note_color_changed(self, note_id: str, new_color: str) -> None:
         """付箋の色が変更されたときのコールバック"""
-        if self.on_notes_changed:
-            self.on_notes_changed(self.all_notes)
+        note = self._find_note_by_id(note_id)
+        if note and self.on_note_updated:
+            self.on_note_updated(note)
@@ -2,7 +2,7 @@
 from dataclasses import dataclass, asdict
 from typing import Dict, Any, Optional, TYPE_CHECKING
 from datetime import datetime
-from utils.constants import DEFAULT_NOTE_COLOR, ID_DATE_FORMAT
+from utils.constants import DEFAULT_NOTE_COLOR, ID_DATE_FORMAT, ID_SUFFIX_SEPARATOR
 
 if TYPE_CHECKING:
     from services.language_service import LanguageService
@@ -48,9 +48,11 @@ class NoteData:
     
     def get_formatted_date(self) -> str:
         """日時をフォーマット済み文字列で取得"""
-        if len(self.id) == 14 and self.id.isdigit():
+        # 重複回避の連番（例: 20250101120000_2）は日時の解釈から除外
+        date_part = self.id.split(ID_SUFFIX_SEPARATOR, 1)[0]
+        if len(date_part) == 14 and date_part.isdigit():
             try:
-                date_obj = datetime.strptime(self.id, ID_DATE_FORMAT)
+                date_obj = datetime.strptime(date_part, ID_DATE_FORMAT)
                 return date_obj.strftime("%Y/%m/%d %H:%M")
             except ValueError:
                 return self.id
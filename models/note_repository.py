@@ -3,8 +3,12 @@ from typing import List, Optional, Protocol
 from abc import abstractmethod
 import json
 import os
+import queue
+import threading
 from models.note_model import NoteData
-from utils.constants import NOTES_FILE
+from utils.constants import (
+    NOTES_FILE, TEMP_FILE_SUFFIX, WRITER_JOIN_TIMEOUT, DEBUG_ENV_VAR
+)
 
 
 class NoteRepositoryInterface(Protocol):
@@ -48,6 +52,18 @@ class JsonNoteRepository:
         self.file_path = file_path
         self._notes_cache: List[NoteData] = []
         self._cache_loaded = False
+        
+        # ファイル書き込みはバックグラウンドスレッドで行う（None は終了指示）
+        self._write_queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        
+        # 書き込み状況（書き込みスレッドと共有するためロックで保護）
+        self._write_lock = threading.Lock()
+        self._pending_writes = 0
+        self._write_error: Optional[Exception] = None
+        self._closed = False  # close 後は書き込みスレッドが停止しているため保存を受け付けない
+        
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
     
     def load_all(self) -> List[NoteData]:
         """すべての付箋データを読み込み"""
@@ -56,16 +72,49 @@ class JsonNoteRepository:
         return self._notes_cache.copy()
     
     def save_all(self, notes: List[NoteData]) -> bool:
-        """すべての付箋データを保存"""
+        """すべての付箋データを保存（書き込みの成否は take_write_error で確認）"""
+        if self._closed:
+            return False
+        
         try:
+            # シリアライズは呼び出し元スレッドで行い、書き込みのみを委譲する
             data = [note.to_dict() for note in notes]
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if os.environ.get(DEBUG_ENV_VAR):
+                text = json.dumps(data, ensure_ascii=False, indent=2)
+            else:
+                text = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+            payload = text.encode("utf-8")
+            with self._write_lock:
+                self._pending_writes += 1
+            self._write_queue.put(payload)
             self._notes_cache = notes.copy()
             return True
         except Exception:
             return False
     
+    def is_writing(self) -> bool:
+        """未完了の書き込みがあるかチェック"""
+        with self._write_lock:
+            return self._pending_writes > 0
+    
+    def take_write_error(self) -> Optional[Exception]:
+        """直近の書き込みで発生したエラーを取得してクリア"""
+        with self._write_lock:
+            error, self._write_error = self._write_error, None
+        return error
+    
+    def close(self) -> bool:
+        """保留中の書き込みを完了させて書き込みスレッドを終了"""
+        self._closed = True
+        if self._writer_thread.is_alive():
+            self._write_queue.put(None)
+            self._writer_thread.join(WRITER_JOIN_TIMEOUT)
+        
+        if self._writer_thread.is_alive() or self.is_writing():
+            # タイムアウトまでに書き込みが完了しなかった
+            return False
+        return self.take_write_error() is None
+    
     def find_by_id(self, note_id: str) -> Optional[NoteData]:
         """IDで付箋を検索"""
         if not self._cache_loaded:
@@ -126,6 +175,49 @@ class JsonNoteRepository:
         
         self._cache_loaded = True
     
+    def _writer_loop(self) -> None:
+        """キューに積まれたデータをファイルに書き込む"""
+        running = True
+        while running:
+            payload = self._write_queue.get()
+            if payload is None:
+                break
+            
+            # 溜まっている書き込みは最新のものだけを書き込む
+            payload_count = 1
+            while True:
+                try:
+                    pending = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    running = False
+                    break
+                payload = pending
+                payload_count += 1
+            
+            error = self._write_to_file(payload)
+            with self._write_lock:
+                self._pending_writes -= payload_count
+                # 最新のデータを書き込めた場合は以前のエラーは解消済み
+                self._write_error = error
+    
+    def _write_to_file(self, payload: bytes) -> Optional[Exception]:
+        """一時ファイル経由でアトミックに書き込む（失敗時は例外を返す）"""
+        temp_path = self.file_path + TEMP_FILE_SUFFIX
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+            os.replace(temp_path, self.file_path)
+            return None
+        except Exception as e:
+            # 書き込み途中の一時ファイルを残さない（削除できなくても元のエラーを優先）
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return e
+    
     def file_exists(self) -> bool:
         """データファイルが存在するかチェック"""
         return os.path.exists(self.file_path)
@@ -11,6 +11,7 @@ class StorageService:
         self.repository = repository or JsonNoteRepository()
         self._error_callback: Optional[Callable[[str], None]] = None
         self._success_callback: Optional[Callable[[str], None]] = None
+        self._last_saved_count = 0
     
     def set_error_callback(self, callback: Callable[[str], None]) -> None:
         """エラーコールバックを設定"""
@@ -36,6 +37,10 @@ class StorageService:
         """すべての付箋を保存"""
         try:
             success = self.repository.save_all(notes)
+            self._last_saved_count = len(notes)
+            if success and self.is_async_write():
+                # 書き込み完了は check_write_result で通知する
+                return success
             if success and self._success_callback:
                 self._success_callback(f"{len(notes)}個の付箋を保存しました")
             elif not success and self._error_callback:
@@ -46,6 +51,27 @@ class StorageService:
                 self._error_callback(f"ノートの保存中にエラーが発生しました: {e}")
             return False
     
+    def is_async_write(self) -> bool:
+        """書き込みがバックグラウンドで行われるかチェック"""
+        return hasattr(self.repository, 'is_writing')
+    
+    def check_write_result(self) -> Optional[bool]:
+        """バックグラウンド書き込みの結果を確認（書き込み中は None）"""
+        if not self.is_async_write():
+            return True
+        if self.repository.is_writing():
+            return None
+        
+        error = self.repository.take_write_error()
+        if error is not None:
+            if self._error_callback:
+                self._error_callback(f"ノートの保存中にエラーが発生しました: {error}")
+            return False
+        
+        if self._success_callback:
+            self._success_callback(f"{self._last_saved_count}個の付箋を保存しました")
+        return True
+    
     def find_note_by_id(self, note_id: str) -> Optional[NoteData]:
         """IDで付箋を検索"""
         return self.repository.find_by_id(note_id)
@@ -62,6 +88,16 @@ class StorageService:
         """付箋を削除"""
         return self.repository.delete(note_id)
     
+    def close(self) -> bool:
+        """保留中の書き込みを完了させる"""
+        if not hasattr(self.repository, 'close'):
+            return True
+        
+        success = self.repository.close()
+        if not success and self._error_callback:
+            self._error_callback("ノートの保存に失敗しました")
+        return success
+    
     def is_file_exists(self) -> bool:
         """データファイルが存在するかチェック"""
         if hasattr(self.repository, 'file_exists'):
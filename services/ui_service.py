@@ -4,7 +4,7 @@ UI関連の共通サービス
 import tkinter as tk
 from tkinter import messagebox, colorchooser
 import random
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from services.language_service import get_language_service
 from utils.constants import (
     RANDOM_POSITION_MARGIN, 
@@ -75,37 +75,35 @@ UI操作の共通サービスクラス
         return result[1] if result[1] else None
     
     @staticmethod
-    def configure_window_style(window: tk.Tk, style: Optional[object] = None) -> None:
+    def configure_window_style(window: tk.Tk) -> None:
         """ウィンドウのスタイルを設定"""
-        if style:
-            # スタイルの設定
-            style.theme_use('clam')
-            
+        # スタイル設定を1つの Tcl スクリプトにまとめて一度に実行
+        script = "\n".join([
+            # テーマ（ttk.Style.theme_use と同様に ttk::setTheme で現在のテーマも更新）
+            "ttk::setTheme clam",
             # ボタンスタイル
-            style.configure('TButton', 
-                           font=('Yu Gothic UI', 10),
-                           borderwidth=1,
-                           focusthickness=3,
-                           focuscolor='none')
-            
-            style.map('TButton',
-                     background=[('active', '#e1e1e1'), ('pressed', '#d0d0d0')],
-                     relief=[('pressed', 'sunken')])
-            
+            "ttk::style configure TButton -font {{Yu Gothic UI} 10} -borderwidth 1"
+            " -focusthickness 3 -focuscolor none",
+            "ttk::style map TButton -background {active #e1e1e1 pressed #d0d0d0}"
+            " -relief {pressed sunken}",
             # タブスタイル
-            style.configure('TNotebook.Tab', 
-                           font=('Yu Gothic UI', 10),
-                           padding=[10, 4])
+            "ttk::style configure TNotebook.Tab -font {{Yu Gothic UI} 10} -padding {10 4}",
+        ])
+        window.tk.eval(script)
     
     @staticmethod
     def bind_window_events(window: tk.Toplevel, drag_start_func, drag_func, 
                           resize_start_func, resize_func, 
-                          drag_handle: tk.Widget, resize_handle: tk.Widget) -> None:
-        """ウィンドウのイベントをバインド"""
+                          drag_handle: tk.Widget, resize_handle: tk.Widget) -> List[Tuple[tk.Widget, str, str]]:
+        """ウィンドウのイベントをバインドし、(ウィジェット, シーケンス, funcid) のリストを返す"""
+        bindings = []
+        
         # ドラッグイベント
-        drag_handle.bind("<Button-1>", drag_start_func)
-        drag_handle.bind("<B1-Motion>", drag_func)
+        bindings.append((drag_handle, "<Button-1>", drag_handle.bind("<Button-1>", drag_start_func)))
+        bindings.append((drag_handle, "<B1-Motion>", drag_handle.bind("<B1-Motion>", drag_func)))
         
         # リサイズイベント
-        resize_handle.bind("<Button-1>", resize_start_func)
-        resize_handle.bind("<B1-Motion>", resize_func)
+        bindings.append((resize_handle, "<Button-1>", resize_handle.bind("<Button-1>", resize_start_func)))
+        bindings.append((resize_handle, "<B1-Motion>", resize_handle.bind("<B1-Motion>", resize_func)))
+        
+        return bindings
@@ -2,6 +2,8 @@
 
 # ファイル名
 NOTES_FILE = "free_sticky.json"
+TEMP_FILE_SUFFIX = ".tmp"
+DEBUG_ENV_VAR = "DEBUG"  # 設定されているとデータファイルを整形して保存
 
 # デフォルト値
 DEFAULT_NOTE_COLOR = "#FFFF99"
@@ -36,14 +38,19 @@ STATUS_BAR_HEIGHT = 1  # ステータスバーの固定高さ（行数）
 TEXT_PREVIEW_MAX_LENGTH = 80
 DATE_FORMAT = "%Y/%m/%d %H:%M"
 ID_DATE_FORMAT = "%Y%m%d%H%M%S"
+ID_SUFFIX_SEPARATOR = "_"  # 同じ秒に作成された付箋のIDを区別するための区切り文字
 
 # ウィンドウ設定
 ALWAYS_ON_TOP = True
 RANDOM_POSITION_MARGIN = 50
 RANDOM_POSITION_OFFSET = 250
+GEOMETRY_UPDATE_INTERVAL = 16  # ドラッグ・リサイズ時のジオメトリ更新間隔（ミリ秒）
+SAVE_DEBOUNCE_INTERVAL = 500  # 保存をまとめて書き込むまでの待機時間（ミリ秒）
+WRITER_JOIN_TIMEOUT = 5.0  # 終了時に書き込みスレッドの完了を待つ最大時間（秒）
+WRITE_RESULT_POLL_INTERVAL = 100  # 書き込み結果を確認する間隔（ミリ秒）
+SEARCH_DEBOUNCE_INTERVAL = 150  # 検索入力後に絞り込みを行うまでの待機時間（ミリ秒）
 
 # リストビューカラム幅
-COLUMN_ID_WIDTH = 0
 COLUMN_DATE_WIDTH = 140
 COLUMN_PREVIEW_WIDTH = 350
 COLUMN_STATUS_WIDTH = 80
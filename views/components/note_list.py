@@ -1,23 +1,34 @@
 """付箋リストコンポーネント"""
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Set, Tuple
 from models.note_model import NoteData
 from services.language_service import get_language_service
 from utils.constants import (
-    COLUMN_ID_WIDTH, COLUMN_DATE_WIDTH, COLUMN_PREVIEW_WIDTH, COLUMN_STATUS_WIDTH,
-    TEXT_PREVIEW_MAX_LENGTH
+    COLUMN_DATE_WIDTH, COLUMN_PREVIEW_WIDTH, COLUMN_STATUS_WIDTH,
+    TEXT_PREVIEW_MAX_LENGTH, SEARCH_DEBOUNCE_INTERVAL
 )
 
 
 class NoteListComponent:
     """付箋リストを表示するコンポーネント"""
     
+    _COLUMNS = ("date", "preview", "status")
+    
     def __init__(self, parent: tk.Widget):
         self.parent = parent
         self.language_service = get_language_service()
         self.search_var = tk.StringVar()
         self.all_notes: List[NoteData] = []
+        self._notes_by_id: Dict[str, NoteData] = {}
+        self._derived_cache: Dict[str, Dict[str, str]] = {}  # 付箋ID -> 表示用に加工した値
+        self._date_display_cache: Dict[str, str] = {}  # 付箋ID -> 表示用の日時（IDは不変）
+        self._tree_items: Set[str] = set()  # 表示中の付箋ID（ツリービューの項目IDと同じ）
+        self._last_values: Dict[str, Tuple[str, str, str]] = {}  # 付箋ID -> 表示中の行の値
+        self._search_after_id: Optional[str] = None
+        self._list_dirty = False
+        self._pending_rows: Set[str] = set()
+        self._refresh_scheduled = False
         self._create_widgets()
         self._setup_events()
         
@@ -47,16 +58,14 @@ class NoteListComponent:
         list_view_frame.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
         
         # ツリービュー
-        self.tree = ttk.Treeview(list_view_frame, columns=("id", "date", "preview", "status"), 
+        self.tree = ttk.Treeview(list_view_frame, columns=self._COLUMNS, 
                               show="headings", selectmode="browse")
         
         # カラム設定
-        self.tree.heading("id", text=self.language_service.translate("id"))
         self.tree.heading("date", text=self.language_service.translate("date"))
         self.tree.heading("preview", text=self.language_service.translate("content"))
         self.tree.heading("status", text=self.language_service.translate("status"))
         
-        self.tree.column("id", width=COLUMN_ID_WIDTH, minwidth=0, stretch=tk.NO)
         self.tree.column("date", width=COLUMN_DATE_WIDTH, anchor="w")
         self.tree.column("preview", width=COLUMN_PREVIEW_WIDTH, anchor="w", stretch=tk.YES)
         self.tree.column("status", width=COLUMN_STATUS_WIDTH, anchor="center")
@@ -72,7 +81,7 @@ class NoteListComponent:
     def _setup_events(self) -> None:
         """イベントを設定"""
         # 検索イベント
-        self.search_var.trace("w", lambda *args: self._filter_notes())
+        self.search_var.trace_add("write", self._on_search_changed)
         
         # リストイベント
         self.tree.bind("<Double-1>", self._on_double_click)
@@ -84,49 +93,165 @@ class NoteListComponent:
         self.search_label.configure(text=self.language_service.translate("search"))
         
         # カラムヘッダーを更新
-        self.tree.heading("id", text=self.language_service.translate("id"))
         self.tree.heading("date", text=self.language_service.translate("date"))
         self.tree.heading("preview", text=self.language_service.translate("content"))
         self.tree.heading("status", text=self.language_service.translate("status"))
         
         # リストを再表示して状態テキストを更新
-        self._filter_notes()
+        self._schedule_list_refresh()
     
     def set_notes(self, notes: List[NoteData]) -> None:
         """付箋リストを設定"""
         self.all_notes = notes
-        self._filter_notes()
+        self._notes_by_id = {note.id: note for note in notes}
+        self._derived_cache = {
+            note_id: derived for note_id, derived in self._derived_cache.items()
+            if note_id in self._notes_by_id
+        }
+        
+        # 表示用の日時はIDから決まるため、新しく追加された付箋の分だけ計算
+        date_display_cache: Dict[str, str] = {}
+        for note in notes:
+            date_display = self._date_display_cache.get(note.id)
+            if date_display is None:
+                date_display = note.get_formatted_date()
+            date_display_cache[note.id] = date_display
+        self._date_display_cache = date_display_cache
+        
+        self._schedule_list_refresh()
     
     def refresh(self) -> None:
         """リストを更新"""
-        self._filter_notes()
+        self._schedule_list_refresh()
+    
+    def schedule_row_update(self, note_id: str) -> None:
+        """指定した付箋の行の更新をアイドル時に予約"""
+        self._pending_rows.add(note_id)
+        self._schedule_idle_refresh()
+    
+    def update_row(self, note_id: str) -> None:
+        """指定した付箋の行のみを更新"""
+        if self._list_dirty:
+            # 再構築が予約済みなのでそちらに任せる
+            return
+        
+        note = self._notes_by_id.get(note_id)
+        if note is None:
+            return
+        
+        is_visible = note_id in self._tree_items
+        if self._matches_filter(note, self.search_var.get().lower()):
+            if not is_visible:
+                # 表示順を保つため新たに表示対象となった場合は再構築
+                self._apply_filter()
+                return
+            self._update_changed_cells(note_id, self._row_values(note))
+        elif is_visible:
+            self.tree.delete(note_id)
+            self._tree_items.discard(note_id)
+            self._last_values.pop(note_id, None)
     
     def get_selected_note_id(self) -> Optional[str]:
         """選択された付箋のIDを取得"""
         selected = self.tree.selection()
         if selected:
-            item_id = selected[0]
-            return self.tree.item(item_id, "values")[0]
+            # 項目IDとして付箋IDを使用している
+            return selected[0]
         return None
     
-    def _filter_notes(self) -> None:
-        """検索条件でフィルタリング"""
+    def _schedule_list_refresh(self) -> None:
+        """リストの再構築をアイドル時に予約（連続した更新を1回にまとめる）"""
+        self._list_dirty = True
+        self._schedule_idle_refresh()
+    
+    def _schedule_idle_refresh(self) -> None:
+        """予約された更新をアイドル時に実行するよう登録"""
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self.tree.after_idle(self._maybe_refresh_list)
+    
+    def _maybe_refresh_list(self) -> None:
+        """予約されたリストの再構築または行の更新を実行"""
+        self._refresh_scheduled = False
+        if self._list_dirty:
+            self._apply_filter()
+            return
+        
+        pending_rows, self._pending_rows = self._pending_rows, set()
+        for note_id in pending_rows:
+            self.update_row(note_id)
+    
+    def _on_search_changed(self, *args) -> None:
+        """検索文字列が変更されたとき（入力が落ち着いてから絞り込む）"""
+        if self._search_after_id is not None:
+            self.tree.after_cancel(self._search_after_id)
+        self._search_after_id = self.tree.after(SEARCH_DEBOUNCE_INTERVAL, self._apply_filter)
+    
+    def _apply_filter(self) -> None:
+        """検索条件でフィルタリングしてリスト全体を再構築"""
+        if self._search_after_id is not None:
+            self.tree.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self._list_dirty = False
+        self._pending_rows.clear()
+        
         search_text = self.search_var.get().lower()
         
         # ツリービューをクリア
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
+        self._tree_items.clear()
+        self._last_values.clear()
         
-        # フィルタリングして表示
+        # フィルタリングして表示（付箋IDを項目IDとして使用）
         for note in self.all_notes:
-            if (search_text in note.id.lower() or 
-                search_text in note.text.lower()):
-                
-                date_display = note.get_formatted_date()
-                preview = note.get_preview_text(TEXT_PREVIEW_MAX_LENGTH)
-                status = note.get_status_text(self.language_service)
-                
-                self.tree.insert("", "end", values=(note.id, date_display, preview, status))
+            if note.id in self._tree_items:
+                # 項目IDの重複で再構築が中断しないよう、同じIDは1行のみ表示
+                continue
+            if self._matches_filter(note, search_text):
+                values = self._row_values(note)
+                self.tree.insert("", "end", iid=note.id, values=values)
+                self._tree_items.add(note.id)
+                self._last_values[note.id] = values
+    
+    def _update_changed_cells(self, note_id: str, values: Tuple[str, str, str]) -> None:
+        """行の値のうち変更されたセルのみを更新"""
+        last_values = self._last_values.get(note_id)
+        if last_values is None:
+            self.tree.item(note_id, values=values)
+        else:
+            for column, value, last_value in zip(self._COLUMNS, values, last_values):
+                if value != last_value:
+                    self.tree.set(note_id, column, value)
+        self._last_values[note_id] = values
+    
+    def _matches_filter(self, note: NoteData, search_text: str) -> bool:
+        """付箋が検索条件に一致するか判定"""
+        derived = self._get_derived(note)
+        return search_text in derived["id_lower"] or search_text in derived["text_lower"]
+    
+    def _row_values(self, note: NoteData) -> Tuple[str, str, str]:
+        """ツリービューの行に表示する値を取得"""
+        derived = self._get_derived(note)
+        status = note.get_status_text(self.language_service)
+        return (self._date_display_cache[note.id], derived["preview"], status)
+    
+    def _get_derived(self, note: NoteData) -> Dict[str, str]:
+        """表示用に加工した値を取得（テキストが変わったときのみ再計算）"""
+        derived = self._derived_cache.get(note.id)
+        if derived is None or derived["text"] != note.text:
+            derived = self._refresh_derived(note)
+        return derived
+    
+    def _refresh_derived(self, note: NoteData) -> Dict[str, str]:
+        """表示用に加工した値を再計算してキャッシュ"""
+        derived = {
+            "text": note.text,
+            "preview": note.get_preview_text(TEXT_PREVIEW_MAX_LENGTH),
+            "text_lower": note.text.lower(),
+            "id_lower": note.id.lower(),
+        }
+        self._derived_cache[note.id] = derived
+        return derived
     
     def _on_double_click(self, event: tk.Event) -> None:
         """ダブルクリックイベント"""
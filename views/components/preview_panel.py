@@ -1,7 +1,8 @@
 """プレビューパネルコンポーネント"""
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional
+from tkinter import font as tkfont
+from typing import Dict, Optional
 from models.note_model import NoteData
 from services.language_service import get_language_service
 from utils.constants import DEFAULT_FONT, HEADER_FONT, PREVIEW_HEIGHT
@@ -13,22 +14,36 @@ class PreviewPanelComponent:
     def __init__(self, parent: tk.Widget):
         self.parent = parent
         self.language_service = get_language_service()
+        
+        # フォントは一度だけ作成して共有する
+        self._default_font = tkfont.Font(root=parent, font=DEFAULT_FONT)
+        self._header_font = tkfont.Font(root=parent, font=HEADER_FONT)
+        
+        # 翻訳のキャッシュ（言語変更時のみ再取得）
+        self._translation_cache: Dict[str, str] = {}
+        self._refresh_translations()
+        
         self._create_widgets()
     
     def _create_widgets(self) -> None:
         """ウィジェットを作成"""
         # プレビューラベル
-        self.preview_label = ttk.Label(self.parent, text=self.language_service.translate("preview"), font=HEADER_FONT)
+        self.preview_label = ttk.Label(self.parent, text=self._translation_cache["preview"], font=self._header_font)
         self.preview_label.pack(anchor="w", padx=5, pady=2)
         
         # プレビューテキスト
         self.preview_text = tk.Text(self.parent, wrap=tk.WORD, height=PREVIEW_HEIGHT, 
-                                  font=DEFAULT_FONT, state="disabled")
+                                  font=self._default_font, state="disabled")
         self.preview_text.pack(expand=True, fill=tk.BOTH, padx=5, pady=2)
     
+    def _refresh_translations(self) -> None:
+        """翻訳のキャッシュを更新"""
+        self._translation_cache = {"preview": self.language_service.translate("preview")}
+    
     def update_language(self) -> None:
         """UI言語を更新"""
-        self.preview_label.configure(text=self.language_service.translate("preview"))
+        self._refresh_translations()
+        self.preview_label.configure(text=self._translation_cache["preview"])
     
     def update_preview(self, note: Optional[NoteData]) -> None:
         """プレビューを更新"""
@@ -31,6 +31,9 @@ class MainWindow(tk.Tk):
         self.on_change_color: Optional[Callable[[str], None]] = None
         self.on_refresh: Optional[Callable[[], None]] = None
         
+        # 付箋ウィンドウの共有コンテキストメニューの表示対象
+        self._ctx_target: Optional[tk.Toplevel] = None
+        
         self._setup_window()
         self._create_widgets()
         self._setup_events()
@@ -50,7 +53,7 @@ class MainWindow(tk.Tk):
         
         # スタイル設定
         self.style = ttk.Style()
-        UIService.configure_window_style(self, self.style)
+        UIService.configure_window_style(self)
     
     def _create_widgets(self) -> None:
         """ウィジェットを作成"""
@@ -96,6 +99,7 @@ class MainWindow(tk.Tk):
         
         # コンテキストメニュー
         self._create_context_menu()
+        self._create_note_context_menu()
         
         # ステータスバー
         self._create_status_bar()
@@ -129,6 +133,12 @@ class MainWindow(tk.Tk):
         self.context_menu.add_separator()
         self.context_menu.add_command(label=self.language_service.translate("delete"), command=self._on_delete_clicked)
     
+    def _create_note_context_menu(self) -> None:
+        """付箋ウィンドウ共通のコンテキストメニューを作成"""
+        self._note_context_menu = tk.Menu(self, tearoff=0)
+        self._note_context_menu.add_command(label=self.language_service.translate("change_color"), command=self._ctx_change_color)
+        self._note_context_menu.add_command(label=self.language_service.translate("close"), command=self._ctx_close)
+    
     def _create_status_bar(self) -> None:
         """ステータスバーを作成"""
         self.status_var = tk.StringVar()
@@ -150,6 +160,10 @@ class MainWindow(tk.Tk):
         """付箋リストを更新"""
         self.note_list.refresh()
     
+    def update_note_row(self, note_id: str) -> None:
+        """指定した付箋の行のみを更新（アイドル時にまとめて反映）"""
+        self.note_list.schedule_row_update(note_id)
+    
     def update_status(self, message: str) -> None:
         """ステータスメッセージを更新"""
         self.status_var.set(message)
@@ -180,6 +194,8 @@ class MainWindow(tk.Tk):
         
         # コンテキストメニューを再作成
         self._create_context_menu()
+        self._note_context_menu.entryconfigure(0, label=self.language_service.translate("change_color"))
+        self._note_context_menu.entryconfigure(1, label=self.language_service.translate("close"))
         
         # ステータスを更新
         current_status = self.status_var.get()
@@ -247,6 +263,29 @@ class MainWindow(tk.Tk):
         finally:
             self.context_menu.grab_release()
     
+    def show_note_context_menu(self, note_window: tk.Toplevel, x: int, y: int) -> None:
+        """付箋ウィンドウのコンテキストメニューを表示"""
+        self._ctx_target = note_window
+        try:
+            self._note_context_menu.tk_popup(x, y)
+        finally:
+            self._note_context_menu.grab_release()
+    
+    def release_note_context_target(self, note_window: tk.Toplevel) -> None:
+        """破棄される付箋ウィンドウへの参照を解放"""
+        if self._ctx_target is note_window:
+            self._ctx_target = None
+    
+    def _ctx_change_color(self) -> None:
+        """コンテキストメニューから色変更が選択されたとき"""
+        if self._ctx_target is not None and self._ctx_target.winfo_exists():
+            self._ctx_target.change_color()
+    
+    def _ctx_close(self) -> None:
+        """コンテキストメニューから閉じるが選択されたとき"""
+        if self._ctx_target is not None and self._ctx_target.winfo_exists():
+            self._ctx_target.close_note()
+    
     def get_selected_note_id(self) -> Optional[str]:
         """選択された付箋IDを取得"""
         return self.note_list.get_selected_note_id()
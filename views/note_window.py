@@ -1,14 +1,14 @@
 """付箋ウィンドウビュー"""
 import tkinter as tk
 from tkinter import messagebox
-from typing import Callable, Optional
+from typing import Callable, List, Optional, Tuple
 from models.note_model import NoteData
 from services.ui_service import UIService
 from services.language_service import get_language_service
 from utils.constants import (
     DEFAULT_WINDOW_WIDTH, DEFAULT_WINDOW_HEIGHT, MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT,
     ALWAYS_ON_TOP, CONTROL_HEIGHT, RESIZE_HANDLE_SIZE, CONTROL_TEXT_COLOR,
-    DEFAULT_FONT, CONTROL_FONT
+    DEFAULT_FONT, CONTROL_FONT, GEOMETRY_UPDATE_INTERVAL
 )
 
 
@@ -23,6 +23,7 @@ class StickyNoteWindow(tk.Toplevel):
         
         # コールバック
         self.on_save: Optional[Callable[[NoteData], None]] = None
+        self.on_modified: Optional[Callable[[str], None]] = None
         self.on_close: Optional[Callable[[str], None]] = None
         self.on_color_change: Optional[Callable[[str, str], None]] = None
         
@@ -36,6 +37,18 @@ class StickyNoteWindow(tk.Toplevel):
         self.resize_start_width = 0
         self.resize_start_height = 0
         
+        # ジオメトリ更新の間引き用変数
+        self._pending_geometry: Optional[str] = None
+        self._geometry_after_id: Optional[str] = None
+        self._geometry_changed = False  # ドラッグ・リサイズで実際に移動・変形したか
+        
+        # テキスト取得のキャッシュ（<<Modified>> で変更があったときのみ再取得）
+        self._last_text = note_data.text
+        self._text_dirty = False
+        
+        # 後始末で解除するイベントバインドの一覧
+        self._bound_events: List[Tuple[tk.Misc, str, str]] = []  # (ウィジェット, シーケンス, funcid)
+        
         self._setup_window()
         self._create_widgets()
         self._setup_events()
@@ -44,7 +57,7 @@ class StickyNoteWindow(tk.Toplevel):
     def _setup_window(self) -> None:
         """ウィンドウの基本設定"""
         self.overrideredirect(True)
-        self.geometry(f"{DEFAULT_WINDOW_WIDTH}x{DEFAULT_WINDOW_HEIGHT}")
+        # サイズと位置は _apply_note_data で一度にまとめて設定する
         self.config(bg=self.note_data.color)
         self.attributes("-topmost", ALWAYS_ON_TOP)
         self.resizable(True, True)
@@ -80,49 +93,58 @@ class StickyNoteWindow(tk.Toplevel):
                                relief=tk.FLAT, font=DEFAULT_FONT, bd=2)
         self.text_area.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
         
-        # コンテキストメニュー
-        self._create_context_menu()
-    
-    def _create_context_menu(self) -> None:
-        """コンテキストメニューを作成"""
-        self.context_menu = tk.Menu(self, tearoff=0)
-        self.context_menu.add_command(label=self.language_service.translate("change_color"), command=self._change_color)
-        self.context_menu.add_command(label=self.language_service.translate("close"), command=self._on_close_clicked)
+        # 付箋の色を適用するウィジェット
+        self._bg_widgets: List[tk.Misc] = [
+            self, self.text_area, self.control_frame, self.close_button,
+            self.settings_button, self.drag_label, self.resize_frame
+        ]
     
     def _setup_events(self) -> None:
         """イベントを設定"""
         # ボタンイベント
-        self.close_button.bind("<Button-1>", lambda e: self._on_close_clicked())
-        self.settings_button.bind("<Button-1>", self._show_context_menu)
+        self._bind(self.close_button, "<Button-1>", lambda e: self.close_note())
+        self._bind(self.settings_button, "<Button-1>", self._show_context_menu)
         
         # ドラッグイベント
-        UIService.bind_window_events(
+        self._bound_events.extend(UIService.bind_window_events(
             self, self._start_drag, self._on_drag,
             self._start_resize, self._on_resize,
             self.drag_label, self.resize_frame
-        )
+        ))
+        for handle in (self.drag_label, self.resize_frame):
+            # ドラッグ・リサイズ終了時に位置とサイズの変更を通知
+            self._bind(handle, "<ButtonRelease-1>", self._end_geometry_change)
         
         # テキストイベント
-        self.bind("<FocusOut>", self._save_on_focus_out)
-        self.bind("<Control-s>", self._save_note)
-        self.text_area.bind("<Button-3>", self._show_context_menu)
-        self.text_area.bind("<Button-1>", lambda e: self.text_area.focus_set())
+        self._bind(self, "<Control-s>", self._save_note)
+        self._bind(self.text_area, "<Button-3>", self._show_context_menu)
+        self._bind(self.text_area, "<Button-1>", lambda e: self.text_area.focus_set())
+        self._bind(self.text_area, "<<Modified>>", self._on_text_modified)
         
         # ウィンドウイベント
-        self.protocol("WM_DELETE_WINDOW", self._on_close_clicked)
+        self.protocol("WM_DELETE_WINDOW", self.close_note)
+    
+    def _bind(self, widget: tk.Misc, sequence: str, func: Callable) -> None:
+        """イベントをバインドし、後始末用に funcid を記録"""
+        funcid = widget.bind(sequence, func)
+        self._bound_events.append((widget, sequence, funcid))
     
     def _apply_note_data(self) -> None:
         """付箋データをウィンドウに適用"""
         # テキストを設定
         self.text_area.insert(tk.END, self.note_data.text)
+        self.text_area.edit_modified(False)
+        self._text_dirty = False
         
-        # 位置とサイズを設定
+        # 位置とサイズを1回のジオメトリ指定で設定
         if self.note_data.x is not None and self.note_data.y is not None:
-            self.geometry(f"{self.note_data.width}x{self.note_data.height}+{self.note_data.x}+{self.note_data.y}")
+            x, y = self.note_data.x, self.note_data.y
         else:
             # ランダムな位置を設定
             x, y = UIService.get_random_position(self.winfo_screenwidth(), self.winfo_screenheight())
-            self.geometry(f"{self.note_data.width}x{self.note_data.height}+{x}+{y}")
+        width = self.note_data.width or DEFAULT_WINDOW_WIDTH
+        height = self.note_data.height or DEFAULT_WINDOW_HEIGHT
+        self.geometry(f"{width}x{height}+{x}+{y}")
     
     def _start_drag(self, event: tk.Event) -> None:
         """ドラッグ開始"""
@@ -133,7 +155,7 @@ class StickyNoteWindow(tk.Toplevel):
         """ドラッグ処理"""
         x = self.winfo_x() + (event.x - self.drag_start_x)
         y = self.winfo_y() + (event.y - self.drag_start_y)
-        self.geometry(f"+{x}+{y}")
+        self._schedule_geometry(f"+{x}+{y}")
     
     def _start_resize(self, event: tk.Event) -> None:
         """リサイズ開始"""
@@ -148,24 +170,45 @@ class StickyNoteWindow(tk.Toplevel):
                        self.resize_start_width + (event.x_root - self.resize_start_x))
         new_height = max(MIN_WINDOW_HEIGHT, 
                         self.resize_start_height + (event.y_root - self.resize_start_y))
-        self.geometry(f"{new_width}x{new_height}")
+        self._schedule_geometry(f"{new_width}x{new_height}")
+    
+    def _schedule_geometry(self, geometry: str) -> None:
+        """ジオメトリ更新を予約（連続したモーションイベントを1回の更新にまとめる）"""
+        self._pending_geometry = geometry
+        self._geometry_changed = True
+        if self._geometry_after_id is None:
+            self._geometry_after_id = self.after(GEOMETRY_UPDATE_INTERVAL, self._flush_geometry)
+    
+    def _flush_geometry(self) -> None:
+        """予約されたジオメトリ更新を適用"""
+        geometry = self._pending_geometry
+        self._pending_geometry = None
+        self._geometry_after_id = None
+        if geometry:
+            self.geometry(geometry)
+    
+    def _end_geometry_change(self, event: Optional[tk.Event] = None) -> None:
+        """ドラッグ・リサイズ終了"""
+        # 保留中のジオメトリ更新を確定させてから通知
+        if self._geometry_after_id is not None:
+            self.after_cancel(self._geometry_after_id)
+            self._flush_geometry()
+        
+        # 移動・変形のないクリックでは保存しない
+        if self._geometry_changed:
+            self._geometry_changed = False
+            self._notify_modified()
     
     def _show_context_menu(self, event: Optional[tk.Event] = None) -> None:
-        """コンテキストメニュー表示"""
-        try:
-            # メニューを再作成して最新の翻訳を反映
-            self._create_context_menu()
-            
-            if event:
-                self.context_menu.tk_popup(event.x_root, event.y_root)
-            else:
-                x = self.settings_button.winfo_rootx()
-                y = self.settings_button.winfo_rooty() + self.settings_button.winfo_height()
-                self.context_menu.tk_popup(x, y)
-        finally:
-            self.context_menu.grab_release()
-    
-    def _change_color(self) -> None:
+        """コンテキストメニュー表示（メインウィンドウの共有メニューを使用）"""
+        if event:
+            x, y = event.x_root, event.y_root
+        else:
+            x = self.settings_button.winfo_rootx()
+            y = self.settings_button.winfo_rooty() + self.settings_button.winfo_height()
+        self.master.show_note_context_menu(self, x, y)
+    
+    def change_color(self) -> None:
         """色を変更"""
         color = UIService.choose_color(self.note_data.color)
         if color:
@@ -177,17 +220,15 @@ class StickyNoteWindow(tk.Toplevel):
     
     def _apply_color(self, color: str) -> None:
         """色をウィンドウに適用"""
-        self.config(bg=color)
-        self.text_area.config(bg=color)
-        self.control_frame.config(bg=color)
-        self.close_button.config(bg=color)
-        self.settings_button.config(bg=color)
-        self.drag_label.config(bg=color)
-        self.resize_frame.config(bg=color)
-    
-    def _save_on_focus_out(self, event: Optional[tk.Event] = None) -> None:
-        """フォーカスが外れたときに保存"""
-        self._save_note()
+        if self.cget("bg") == color:
+            return
+        for widget in self._bg_widgets:
+            widget.configure(bg=color)
+    
+    def _notify_modified(self) -> None:
+        """変更を通知（保存は遅延して行われる）"""
+        if self.on_modified:
+            self.on_modified(self.note_data.id)
     
     def _save_note(self, event: Optional[tk.Event] = None) -> str:
         """付箋を保存"""
@@ -196,9 +237,25 @@ class StickyNoteWindow(tk.Toplevel):
             self.on_save(self.note_data)
         return "break"
     
+    def _on_text_modified(self, event: Optional[tk.Event] = None) -> None:
+        """テキストが変更されたとき"""
+        # edit_modified(False) による通知は無視する
+        if not self.text_area.edit_modified():
+            return
+        self._text_dirty = True
+        self.text_area.edit_modified(False)
+        self._notify_modified()
+    
+    def _get_text(self) -> str:
+        """テキストを取得（変更がなければキャッシュを返す）"""
+        if self._text_dirty:
+            self._last_text = self.text_area.get("1.0", tk.END).strip()
+            self._text_dirty = False
+        return self._last_text
+    
     def _update_note_data(self) -> None:
         """ウィンドウの状態をデータに反映"""
-        self.note_data.text = self.text_area.get("1.0", tk.END).strip()
+        self.note_data.text = self._get_text()
         self.note_data.x = self.winfo_x()
         self.note_data.y = self.winfo_y()
         self.note_data.width = self.winfo_width()
@@ -206,12 +263,36 @@ class StickyNoteWindow(tk.Toplevel):
         self.note_data.is_open = True
         self.note_data.was_open = True
     
-    def _on_close_clicked(self) -> None:
-        """閉じるボタンがクリックされたとき"""
+    def close_note(self) -> None:
+        """付箋を閉じる"""
         self._save_note()
         self.note_data.is_open = False
         if self.on_close:
             self.on_close(self.note_data.id)
+        self.teardown()
+    
+    def teardown(self) -> None:
+        """バインドとコールバックを解除してウィンドウを破棄"""
+        if self._geometry_after_id is not None:
+            self.after_cancel(self._geometry_after_id)
+            self._geometry_after_id = None
+        
+        # funcid を指定してバインドを解除（登録された Tcl コマンドも削除される）
+        for widget, sequence, funcid in self._bound_events:
+            widget.unbind(sequence, funcid)
+        self._bound_events.clear()
+        self.protocol("WM_DELETE_WINDOW", "")
+        
+        # コントローラーへの参照を切る
+        self.on_save = None
+        self.on_modified = None
+        self.on_close = None
+        self.on_color_change = None
+        
+        # 共有コンテキストメニューの表示対象から外す
+        self.master.release_note_context_target(self)
+        
+        # 子ウィジェットと残りの Tcl コマンドは destroy で解放される
         self.destroy()
     
     def apply_color_change(self, color: str) -> None: